@@ -0,0 +1,165 @@
+"""
+取得済みのHTMLから記事情報を抽出する
+
+記事解析用のワーカープロセスでも読み込まれるため、torch・transformers・pandas等の
+重いライブラリやHTTPセッションには依存させない
+"""
+import re
+from typing import List, Dict, Any, Iterator, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve as sv
+
+# parse_article で参照するタグの部分木だけを構築する（script 等は読み飛ばす）
+ARTICLE_STRAINER = SoupStrainer(["h1", "time", "article", "div", "span", "a"])
+
+# URLに含まれるドメインとソース名の対応（一つの正規表現でまとめて判定する）
+SOURCE_NAMES = {
+    'reuters.com': 'ロイター',
+    'nikkei.com': '日経新聞',
+    'asahi.com': '朝日新聞',
+    'mainichi.jp': '毎日新聞',
+    'yomiuri.co.jp': '読売新聞',
+    'cnn.co.jp': 'CNN',
+    'nhk.or.jp': 'NHK',
+}
+_SOURCE_RE = re.compile('|'.join(re.escape(domain) for domain in SOURCE_NAMES))
+
+# 汎用スクレイピング用のCSSセレクタ（優先順、モジュール読み込み時に一度だけコンパイル）
+TITLE_SELECTORS = [
+    sv.compile(s) for s in ['h1', 'title', '.headline', '.title', '[data-testid="headline"]']
+]
+CONTENT_SELECTORS = [
+    sv.compile(s) for s in [
+        'article', '.article-body', '.content', '.post-content',
+        '.entry-content', '[data-testid="article-body"]', 'main',
+        '.story-body', '.article-content'
+    ]
+]
+DATE_SELECTORS = [
+    sv.compile(s) for s in ['.date', '.published', '.timestamp', 'time', '[datetime]']
+]
+# 候補要素は全セレクタをまとめた1つのクエリで一度に取り出す
+TITLE_QUERY = sv.compile(', '.join(s.pattern for s in TITLE_SELECTORS))
+CONTENT_QUERY = sv.compile(', '.join(s.pattern for s in CONTENT_SELECTORS))
+DATE_QUERY = sv.compile(', '.join(s.pattern for s in DATE_SELECTORS))
+
+def parse_article(html):
+    soup = BeautifulSoup(html, "lxml", parse_only=ARTICLE_STRAINER)
+
+    # タイトルを取得
+    title_tag = soup.find("h1")
+    title = title_tag.get_text(strip=True) if title_tag else "タイトルなし"
+
+    # 日付を取得
+    # たとえば class や要素構造を見て適宜修正
+    date_tag = soup.find("time")
+    if not date_tag:
+        # Bloomberg JP サイトだと span 等に “2025年9月23日 1:40 JST 更新日時 ..." という文字列が入ってることがある
+        # その場合、他の selector を探す
+        date_tag = soup.find("span", {"class": "some‐date‐class"})  # ←要調整
+    date = date_tag.get_text(strip=True) if date_tag else "日付なし"
+
+    # 本文を取得
+    # 本文が <div> タグの中に <p> の形で入ってたりする
+    content_div = soup.find("div", {"class": "body-copy"})  # class 名は実際にサイトの HTML を調べて置き換え
+    if not content_div:
+        # あるいは article タグの中
+        content_div = soup.find("article")
+    paragraphs = []
+    if content_div and isinstance(content_div, Tag):
+        for p in content_div.find_all("p"):
+            text = p.get_text(strip=True)
+            if text:
+                paragraphs.append(text)
+    content = "\n".join(paragraphs)
+
+    # 著者情報
+    author_tag = soup.find("span", {"class": "byline__name"})
+    if not author_tag:
+        author_tag = soup.find("a", {"class": "author-link"})
+    author = author_tag.get_text(strip=True) if author_tag else "著者情報なし"
+
+    return {
+        "title": title,
+        "date": date,
+        "author": author,
+        "content": content
+    }
+
+def _iter_by_priority(soup: BeautifulSoup, query: sv.SoupSieve,
+                      selectors: List[sv.SoupSieve]) -> Iterator[Tag]:
+    """
+    queryで一度だけ木を走査し、各セレクタに最初に一致した要素を優先順に返す
+    （selectorごとにselect_oneした場合と同じ要素を同じ順番で返す）
+    """
+    candidates = query.select(soup)
+    for selector in selectors:
+        for elem in candidates:
+            # 途中でdecomposeされた要素は木から外れているので対象外
+            if not elem.decomposed and selector.match(elem):
+                yield elem
+                break
+
+def parse_article_page(url: str, html: bytes) -> Dict[str, Any]:
+    """
+    取得済みのHTMLからURLに応じて記事情報を抽出する
+    """
+    # URLに基づいてソースを判定
+    if 'bloomberg.com' in url:
+        # Bloomberg記事の場合
+        article = parse_article(html)
+        article['url'] = url
+        article['source'] = 'Bloomberg'
+        return article
+    else:
+        # 汎用的なスクレイピング
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # タイトル取得
+        title = "タイトル不明"
+        for title_elem in _iter_by_priority(soup, TITLE_QUERY, TITLE_SELECTORS):
+            title = title_elem.get_text(strip=True)
+            if len(title) > 5:
+                break
+        
+        # 本文取得
+        content = "本文を取得できませんでした"
+        for content_elem in _iter_by_priority(soup, CONTENT_QUERY, CONTENT_SELECTORS):
+            # スクリプトやスタイルタグを除去
+            for script in content_elem(["script", "style", "nav", "header", "footer", "aside"]):
+                script.decompose()
+            
+            content = content_elem.get_text(strip=True)
+            if len(content) > 100:
+                break
+        
+        # 日付取得（ベストエフォート）
+        date = "日付不明"
+        for date_elem in _iter_by_priority(soup, DATE_QUERY, DATE_SELECTORS):
+            date = date_elem.get_text(strip=True) or date_elem.get('datetime', '日付不明')
+            if date != "日付不明":
+                break
+        
+        # ソース判定
+        match = _SOURCE_RE.search(url)
+        source = SOURCE_NAMES[match.group(0)] if match else "不明"
+        
+        return {
+            'title': title,
+            'content': content,
+            'url': url,
+            'source': source,
+            'date': date,
+            'author': '著者不明'
+        }
+
+def parse_page_safe(url: str, html: bytes) -> Tuple[Dict[str, Any] | None, str | None]:
+    """
+    ワーカープロセス用：解析結果とエラーメッセージの組を返す
+    ワーカーでは表示せず、エラーは親プロセスでログに残す
+    """
+    try:
+        return parse_article_page(url, html), None
+    except Exception as e:
+        return None, str(e)
@@ -0,0 +1,52 @@
+"""
+感情分析モデルをONNX形式に書き出し、INT8に動的量子化する（最初に一度だけ実行）
+
+    python3 export_onnx.py
+
+作成された bert_ja_sent_int8.onnx があれば、main.py はCPUでの推論に ONNX Runtime を使う
+"""
+import torch
+from onnxruntime.quantization import QuantType, quantize_dynamic
+from transformers import AutoModelForSequenceClassification, BertJapaneseTokenizer
+
+FP32_MODEL_PATH = "bert_ja_sent.onnx"
+INT8_MODEL_PATH = "bert_ja_sent_int8.onnx"
+
+INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+def export_onnx(path: str) -> None:
+    """
+    BERTモデルをバッチサイズ・系列長可変のONNXモデルとして書き出す
+    """
+    tokenizer = BertJapaneseTokenizer.from_pretrained(
+        "cl-tohoku/bert-base-japanese-whole-word-masking"
+    )
+    model = AutoModelForSequenceClassification.from_pretrained(
+        "koheiduck/bert-japanese-finetuned-sentiment"
+    ).eval()
+
+    sample = tokenizer(["株価が上昇した", "円安が進む"], return_tensors="pt", padding=True)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in INPUT_NAMES}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    torch.onnx.export(
+        model,
+        tuple(sample[name] for name in INPUT_NAMES),
+        path,
+        input_names=INPUT_NAMES,
+        output_names=["logits"],
+        dynamic_axes=dynamic_axes,
+        opset_version=17,
+        dynamo=False,
+    )
+
+def main():
+    print(f"ONNXモデルを書き出し中: {FP32_MODEL_PATH}")
+    export_onnx(FP32_MODEL_PATH)
+
+    print(f"INT8に量子化中: {INT8_MODEL_PATH}")
+    quantize_dynamic(FP32_MODEL_PATH, INT8_MODEL_PATH, weight_type=QuantType.QInt8)
+    print("完了しました。")
+
+if __name__ == "__main__":
+    main()
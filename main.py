@@ -1,46 +1,172 @@
-import requests
-from bs4 import BeautifulSoup, Tag
-import time
+from __future__ import annotations
+
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup
+import importlib.util
+import logging
+import multiprocessing
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Any
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from typing import TYPE_CHECKING, List, Dict, Any
 import numpy as np
-from scraper_template import fetch_bloomberg_article, parse_article
+from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
+from article_parser import parse_article_page, parse_page_safe
+from scraper_template import (
+    CACHE_EXPIRE_AFTER,
+    CACHE_NAME,
+    HEADERS,
+    cached_get,
+    fetch_bloomberg_article,
+    parse_article,
+)
+
+# 記事解析のワーカープロセスはこのファイルを読み込み直すので、
+# torch・transformers・pandas・matplotlib は使う関数の中でimportする
+if TYPE_CHECKING:
+    import pandas as pd
+
+# export_onnx.py で作成するINT8量子化済みのONNXモデル（あればCPU推論に使う）
+ONNX_MODEL_PATH = "bert_ja_sent_int8.onnx"
+
+# BERT感情分析のライブラリの有無（オプション、importはモデルのロード時に行う）
+_MISSING_SENTIMENT_LIBS = [
+    name for name in ("torch", "transformers") if importlib.util.find_spec(name) is None
+]
+if _MISSING_SENTIMENT_LIBS:
+    print(f"感情分析ライブラリが見つかりません: {', '.join(_MISSING_SENTIMENT_LIBS)}")
+    print("感情分析機能は無効になります。")
+    SENTIMENT_ANALYSIS_AVAILABLE = False
+else:
+    SENTIMENT_ANALYSIS_AVAILABLE = True
+
+# uvloopがあればasyncioのイベントループとして使う（オプション）
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
-# BERT感情分析のインポート（オプション）
+# aiohttp-client-cache があればCSV一括取得の結果もSQLiteにキャッシュする（オプション）
 try:
+    from aiohttp_client_cache import CachedSession
+    # SQLiteBackendはaiosqliteが無いとimportだけ成功して使用時に失敗するので、モジュールから直接importする
+    from aiohttp_client_cache.backends.sqlite import SQLiteBackend
+    AIOHTTP_CACHE_AVAILABLE = True
+except ImportError:
+    AIOHTTP_CACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# グラフの日本語フォント（create_sentiment_timeline_chart でmatplotlibをimportしたときに設定する）
+JAPANESE_FONTS = ['DejaVu Sans', 'Hiragino Sans', 'Yu Gothic', 'Meiryo', 'Takao', 'IPAexGothic', 'IPAPGothic', 'VL PGothic', 'Noto Sans CJK JP']
+
+# CSV一括処理で記事ごとの処理状況を画面にも表示するか（Falseなら進捗バーとログファイルのみ）
+VERBOSE = False
+
+# CSV一括処理の記事ごとの処理状況を残すログファイル
+LOG_FILE = "scraper.log"
+
+# 感情分析で一度にモデルへ渡す文の数
+SENTIMENT_BATCH_SIZE = 32
+
+# CSV一括処理時の同時接続数の上限
+FETCH_CONCURRENCY = 8
+
+# 記事解析をワーカープロセスへまとめて渡す件数（プロセス間通信の回数を減らす）
+PARSE_CHUNKSIZE = 8
+
+# CSV一括処理時に同じホストへリクエストを送る最小間隔（秒、サーバー負荷軽減）
+# 従来の逐次処理と同じ2秒を保ち、高速化は応答待ちを重ねる分だけにとどめる
+HOST_REQUEST_INTERVAL = 2.0
+
+# extract_text_from_html で使う正規表現（呼び出しごとにコンパイルしない）
+_WS_RE = re.compile(r'\s+')
+_KEEP_RE = re.compile(r'[^\w\s\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\u3000-\u303F。、！？]')
+# _KEEP_RE で消えるASCII記号は先に変換表で一括削除しておく（\w に含まれる '_' は残す）
+_ASCII_PUNCT_DELETE = str.maketrans('', '', string.punctuation.replace('_', ''))
+
+# 感情分析用に本文を文へ分割する区切り文字
+_SENT_RE = re.compile(r'[。！？\n]+')
+
+# 感情分析モデル（load_sentiment_model で初めて使うときにロードする）
+tokenizer = None
+model = None
+ort_session = None
+DEVICE = "cpu"
+
+def load_sentiment_model() -> None:
+    """
+    BERTを用いた日本語の感情分析モデルをロードする（ロード済みなら何もしない）
+    記事解析用のワーカープロセスでモデルがロード・複製されないよう、import時にはロードしない
+    ロードに失敗した場合は例外を送出し、次回の呼び出しで再度ロードを試みる
+    """
+    global tokenizer, model, ort_session, DEVICE
+    if model is not None or ort_session is not None:
+        return
+    
     import torch
     from transformers import (
         AutoTokenizer,
         AutoModelForSequenceClassification,
         BertJapaneseTokenizer,
     )
-    SENTIMENT_ANALYSIS_AVAILABLE = True
     
-    # BERTを用いた日本語の感情分析モデルをロード
     print("BERT感情分析モデルをロード中...")
-    tokenizer = BertJapaneseTokenizer.from_pretrained(
-        "cl-tohoku/bert-base-japanese-whole-word-masking"
-    )
-    model = AutoModelForSequenceClassification.from_pretrained(
-        "koheiduck/bert-japanese-finetuned-sentiment"
-    )
+    # 途中で失敗しても中途半端な状態が残らないよう、全てロードできてからグローバルに設定する
+    # Rust実装の高速トークナイザーを優先し、使えなければ従来のトークナイザーを使う
+    try:
+        new_tokenizer = AutoTokenizer.from_pretrained(
+            "cl-tohoku/bert-base-japanese-whole-word-masking", use_fast=True
+        )
+    except (ValueError, OSError):
+        new_tokenizer = BertJapaneseTokenizer.from_pretrained(
+            "cl-tohoku/bert-base-japanese-whole-word-masking"
+        )
+    # GPUがあればGPUで推論する
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    
+    # CPUではONNX Runtime用のモデルがあればそちらを使う（オプション）
+    new_session = None
+    if device == "cpu" and os.path.exists(ONNX_MODEL_PATH):
+        try:
+            import onnxruntime as ort
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.intra_op_num_threads = os.cpu_count() or 1
+            new_session = ort.InferenceSession(
+                ONNX_MODEL_PATH, options, providers=["CPUExecutionProvider"]
+            )
+            print(f"ONNX Runtimeで推論します: {ONNX_MODEL_PATH}")
+        except ImportError:
+            print("onnxruntimeが見つからないため、PyTorchで推論します。")
+    
+    new_model = None
+    if new_session is None:
+        new_model = AutoModelForSequenceClassification.from_pretrained(
+            "koheiduck/bert-japanese-finetuned-sentiment"
+        ).to(device).eval()
+        
+        # GPUが無い環境ではLinear層をINT8に動的量子化してCPU推論を高速化する
+        # （softmaxやLayerNormはFP32のまま）
+        if device == "cpu":
+            new_model = torch.ao.quantization.quantize_dynamic(
+                new_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+    
+    tokenizer, model, ort_session, DEVICE = new_tokenizer, new_model, new_session, device
     print("BERT感情分析モデルのロードが完了しました。")
-    
-except ImportError as e:
-    print(f"感情分析ライブラリが見つかりません: {e}")
-    print("感情分析機能は無効になります。")
-    SENTIMENT_ANALYSIS_AVAILABLE = False
 
 def extract_text_from_html(html_content: str) -> str:
     """
     HTMLコンテンツからテキストを抽出し、不要な要素を除去する
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     
     # スクリプトやスタイルタグを除去
     for script in soup(["script", "style"]):
@@ -55,46 +181,80 @@ def extract_text_from_html(html_content: str) -> str:
     text = ' '.join(chunk for chunk in chunks if chunk)
     
     # 不要な文字を除去（日本語文字と基本的な句読点を保持）
-    text = re.sub(r'\s+', ' ', text)  # 複数の空白を1つに
-    text = re.sub(r'[^\w\s\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\u3000-\u303F。、！？]', '', text)
+    text = _WS_RE.sub(' ', text)  # 複数の空白を1つに
+    text = _KEEP_RE.sub('', text.translate(_ASCII_PUNCT_DELETE))
     
     return text
 
-def get_sentiment_score(text: str) -> float:
+def get_sentiment_scores(texts: List[str], progress: bool = False) -> List[float]:
     """
-    テキストの感情スコアを計算する（BERT使用）
+    複数の文の感情スコアをミニバッチでまとめて計算する（BERT使用）
+    progress が True の場合はバッチ単位の進捗バーを表示する
     """
     if not SENTIMENT_ANALYSIS_AVAILABLE:
-        return 0.0
+        return [0.0] * len(texts)
     
-    try:
-        inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-        with torch.no_grad():
-            logits = model(**inputs).logits
-        prob = torch.softmax(logits, dim=1)[0]
-        return float(prob[2] - prob[1])  # Positive - Negative
-    except Exception as e:
-        print(f"感情分析エラー: {e}")
-        return 0.0
+    load_sentiment_model()
+    import torch
+    
+    # 文字数順に並べてからバッチを作り、バッチごとのパディングを最小限にする
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    scores = [0.0] * len(texts)
+    batch_starts = range(0, len(order), SENTIMENT_BATCH_SIZE)
+    for start in tqdm(batch_starts, desc="感情分析", disable=not progress):
+        indices = order[start:start + SENTIMENT_BATCH_SIZE]
+        batch = [texts[i] for i in indices]
+        try:
+            if ort_session is not None:
+                inputs = tokenizer(
+                    batch, return_tensors="np", padding=True, truncation=True, max_length=512
+                )
+                feed = {i.name: inputs[i.name].astype(np.int64) for i in ort_session.get_inputs()}
+                logits = torch.from_numpy(ort_session.run(None, feed)[0])
+            else:
+                inputs = tokenizer(
+                    batch, return_tensors="pt", padding=True, truncation=True, max_length=512
+                ).to(DEVICE)
+                # GPUではFP16の自動混合精度で推論する（CPUはINT8量子化済みのためそのまま）
+                with torch.inference_mode(), torch.autocast(
+                    device_type=DEVICE, dtype=torch.float16, enabled=DEVICE == "cuda"
+                ):
+                    logits = model(**inputs).logits
+            prob = torch.softmax(logits, dim=1)
+            batch_scores = (prob[:, 2] - prob[:, 1]).tolist()  # Positive - Negative
+        except Exception as e:
+            print(f"感情分析エラー: {e}")
+            batch_scores = [0.0] * len(batch)
+        
+        # 元の文の順番に戻す
+        for i, score in zip(indices, batch_scores):
+            scores[i] = score
+    
+    return scores
 
-def analyze_article_sentiment(article: Dict[str, Any]) -> Dict[str, Any]:
+def get_sentiment_score(text: str) -> float:
     """
-    記事のコンテンツに対して感情分析を実行する
+    テキストの感情スコアを計算する（BERT使用）
+    """
+    return get_sentiment_scores([text])[0]
+
+def _sentences_for_sentiment(article: Dict[str, Any], verbose: bool) -> List[str] | None:
+    """
+    記事の本文を感情分析用の文に分割する（短すぎる文は除外）
+    分析できない記事は article['sentiment'] に理由を設定してNoneを返す
     """
-    if not SENTIMENT_ANALYSIS_AVAILABLE:
-        print("感情分析機能が利用できません。")
-        return article
-    
     content = article.get('content', '')
     if not content or content == "本文取得に失敗しました" or content == "本文を取得できませんでした":
-        print(f"記事「{article.get('title', 'タイトル不明')[:30]}...」の本文が取得できていません。")
+        if verbose:
+            print(f"記事「{article.get('title', 'タイトル不明')[:30]}...」の本文が取得できていません。")
         article['sentiment'] = {
             'available': False,
             'message': '本文が取得できていないため分析できません'
         }
-        return article
+        return None
     
-    print(f"感情分析中: {article.get('title', 'タイトル不明')[:30]}...")
+    if verbose:
+        print(f"感情分析中: {article.get('title', 'タイトル不明')[:30]}...")
     
     # HTMLの場合はテキストを抽出
     if '<' in content and '>' in content:
@@ -107,32 +267,31 @@ def analyze_article_sentiment(article: Dict[str, Any]) -> Dict[str, Any]:
             'available': False,
             'message': '分析可能なテキストが見つかりません'
         }
-        return article
+        return None
     
-    # テキストを文（句点「。」）で分割
-    sentences = [s.strip() for s in text_content.split('。') if s.strip()]
+    # テキストを文（句点「。」・「！」「？」・改行）で分割
+    sentences = [s.strip() for s in _SENT_RE.split(text_content) if s.strip()]
     
     if not sentences:
         article['sentiment'] = {
             'available': False,
             'message': '文に分割できませんでした'
         }
-        return article
-    
-    print(f"  {len(sentences)}個の文を分析中...")
-    
-    # 各文のスコアを計算
-    scores = []
-    for sentence in sentences:
-        if len(sentence) > 5:  # 短すぎる文は除外
-            score = get_sentiment_score(sentence)
-            scores.append(score)
+        return None
     
+    return [s for s in sentences if len(s) > 5]
+
+def _summarize_sentiment(article: Dict[str, Any], scores: List[float], verbose: bool) -> None:
+    """
+    文ごとの感情スコアを集計して article['sentiment'] に設定する
+    """
     if scores:
-        average_score = sum(scores) / len(scores)
-        positive_count = sum(1 for s in scores if s > 0.1)
-        negative_count = sum(1 for s in scores if s < -0.1)
-        neutral_count = len(scores) - positive_count - negative_count
+        # 集計はNumPyでまとめて行う
+        score_array = np.asarray(scores)
+        average_score = float(score_array.mean())
+        positive_count = int((score_array > 0.1).sum())
+        negative_count = int((score_array < -0.1).sum())
+        neutral_count = len(score_array) - positive_count - negative_count
         
         # 感情の判定
         if average_score > 0.1:
@@ -152,108 +311,189 @@ def analyze_article_sentiment(article: Dict[str, Any]) -> Dict[str, Any]:
             'total_sentences': len(scores)
         }
         
-        print(f"  結果: {overall_sentiment} (スコア: {average_score:.4f})")
+        if verbose:
+            print(f"  結果: {overall_sentiment} (スコア: {average_score:.4f})")
     else:
         article['sentiment'] = {
             'available': False,
             'message': '分析できる文が見つかりませんでした'
         }
+
+def _load_model_for(articles: List[Dict[str, Any]]) -> bool:
+    """
+    感情分析モデルをロードする
+    ロードに失敗した場合は中立のスコアにせず、各記事を分析不可として False を返す
+    """
+    try:
+        load_sentiment_model()
+        return True
+    except Exception as e:
+        print(f"感情分析モデルのロードエラー: {e}")
+        for article in articles:
+            article['sentiment'] = {
+                'available': False,
+                'message': '感情分析モデルをロードできなかったため分析できません'
+            }
+        return False
+
+def analyze_article_sentiment(article: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
+    """
+    記事のコンテンツに対して感情分析を実行する
+    verbose が False の場合は途中経過を表示しない
+    """
+    if not SENTIMENT_ANALYSIS_AVAILABLE:
+        print("感情分析機能が利用できません。")
+        return article
+    
+    sentences = _sentences_for_sentiment(article, verbose)
+    if sentences is None or not _load_model_for([article]):
+        return article
     
+    _summarize_sentiment(article, get_sentiment_scores(sentences), verbose)
     return article
 
+def analyze_articles_sentiment(articles: List[Dict[str, Any]], verbose: bool = False) -> None:
+    """
+    複数の記事の感情分析をまとめて実行する
+    全記事の文を1つのリストにしてBERTに渡し、記事をまたいでバッチ推論する
+    """
+    if not SENTIMENT_ANALYSIS_AVAILABLE:
+        print("感情分析機能が利用できません。")
+        return
+    
+    targets = []
+    all_sentences = []
+    for article in articles:
+        sentences = _sentences_for_sentiment(article, verbose)
+        if sentences is not None:
+            targets.append((article, len(all_sentences), len(sentences)))
+            all_sentences.extend(sentences)
+    
+    # 分析できる記事が無ければモデルをロードしない
+    if not targets or not _load_model_for([article for article, _, _ in targets]):
+        return
+    
+    scores = get_sentiment_scores(all_sentences, progress=True)
+    
+    # 記事ごとのスコアに切り分けて集計
+    for article, offset, count in targets:
+        _summarize_sentiment(article, scores[offset:offset + count], verbose)
+
 def scrape_single_article(url: str) -> Dict[str, Any] | None:
     """
     単一の記事URLから記事情報を取得する汎用関数
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
         print(f"記事を取得中: {url}")
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        response = cached_get(url)
         
-        # URLに基づいてソースを判定
-        if 'bloomberg.com' in url:
-            # Bloomberg記事の場合
-            article = parse_article(response.text)
-            article['url'] = url
-            article['source'] = 'Bloomberg'
-            return article
-        else:
-            # 汎用的なスクレイピング
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # タイトル取得
-            title_selectors = ['h1', 'title', '.headline', '.title', '[data-testid="headline"]']
-            title = "タイトル不明"
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 5:
-                        break
-            
-            # 本文取得
-            content_selectors = [
-                'article', '.article-body', '.content', '.post-content', 
-                '.entry-content', '[data-testid="article-body"]', 'main',
-                '.story-body', '.article-content'
-            ]
-            
-            content = "本文を取得できませんでした"
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # スクリプトやスタイルタグを除去
-                    for script in content_elem(["script", "style", "nav", "header", "footer", "aside"]):
-                        script.decompose()
-                    
-                    content = content_elem.get_text(strip=True)
-                    if len(content) > 100:
-                        break
-            
-            # 日付取得（ベストエフォート）
-            date_selectors = ['.date', '.published', '.timestamp', 'time', '[datetime]']
-            date = "日付不明"
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    date = date_elem.get_text(strip=True) or date_elem.get('datetime', '日付不明')
-                    if date != "日付不明":
-                        break
-            
-            # ソース判定
-            source = "不明"
-            if 'reuters.com' in url:
-                source = 'ロイター'
-            elif 'nikkei.com' in url:
-                source = '日経新聞'
-            elif 'asahi.com' in url:
-                source = '朝日新聞'
-            elif 'mainichi.jp' in url:
-                source = '毎日新聞'
-            elif 'yomiuri.co.jp' in url:
-                source = '読売新聞'
-            elif 'cnn.co.jp' in url:
-                source = 'CNN'
-            elif 'nhk.or.jp' in url:
-                source = 'NHK'
-            
-            return {
-                'title': title,
-                'content': content,
-                'url': url,
-                'source': source,
-                'date': date,
-                'author': '著者不明'
-            }
+        # 文字列にデコードせずバイト列のまま渡し、エンコーディングはlxml側で判定させる
+        return parse_article_page(url, response.content)
             
     except Exception as e:
         print(f"記事取得エラー: {e}")
         return None
 
+async def _wait_for_host(next_slot: Dict[str, float], url: str) -> None:
+    """
+    同じホストへのリクエストがHOST_REQUEST_INTERVAL秒以上空くまで待つ
+    """
+    loop = asyncio.get_running_loop()
+    host = urlparse(url).netloc
+    now = loop.time()
+    slot = max(now, next_slot.get(host, now))
+    next_slot[host] = slot + HOST_REQUEST_INTERVAL
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+async def _fetch(session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                 next_slot: Dict[str, float], url: str) -> bytes | BaseException:
+    """
+    同時接続数とホストごとの間隔を制限しつつ1件のHTMLを取得する
+    失敗した場合は例外を送出せずに例外オブジェクトを返す
+    """
+    async with sem:
+        try:
+            # 有効期限内のキャッシュがあるURLはサーバーにアクセスしないので間隔を空けない
+            # （has_urlは期限切れのエントリでもTrueになるため、get_responseで期限も確認する）
+            if not (AIOHTTP_CACHE_AVAILABLE and await session.cache.get_response(
+                    session.cache.create_key('GET', url)) is not None):
+                await _wait_for_host(next_slot, url)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.read()
+        except Exception as e:
+            return e
+
+async def fetch_pages_async(urls: List[str]) -> Dict[str, bytes | BaseException]:
+    """
+    複数URLのHTMLを並行して取得する
+    失敗したURLには例外オブジェクトを対応させる
+    """
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+    next_slot: Dict[str, float] = {}
+    timeout = aiohttp.ClientTimeout(total=15)
+    if AIOHTTP_CACHE_AVAILABLE:
+        # requests-cache と同じファイルだと形式が衝突するので別名にする
+        cache = SQLiteBackend(f"{CACHE_NAME}_async", expire_after=CACHE_EXPIRE_AFTER)
+        session = CachedSession(cache=cache, headers=HEADERS, timeout=timeout)
+    else:
+        session = aiohttp.ClientSession(headers=HEADERS, timeout=timeout)
+    async with session:
+        # 1件ごとにprintせず、進捗バーでまとめて表示する
+        # （失敗は_fetchが例外オブジェクトとして返すので、return_exceptionsは使わない）
+        results = await tqdm_asyncio.gather(
+            *[_fetch(session, sem, next_slot, url) for url in urls],
+            desc="記事取得"
+        )
+    return dict(zip(urls, results))
+
+def fetch_pages(urls: List[str]) -> Dict[str, bytes | BaseException]:
+    """
+    fetch_pages_asyncの同期ラッパー（重複URLは1回だけ取得する）
+    """
+    coro = fetch_pages_async(list(dict.fromkeys(urls)))
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+def _log(message: str) -> None:
+    """
+    CSV一括処理の記事ごとの処理状況をログファイルに残す（VERBOSEなら画面にも表示）
+    """
+    logger.info(message)
+    if VERBOSE:
+        tqdm.write(message)
+
+def parse_pages(pages: Dict[str, bytes | BaseException]) -> Dict[str, Dict[str, Any] | None]:
+    """
+    取得済みのHTMLをプロセスプールで並列に解析する
+    取得・解析に失敗したURLにはNoneを対応させる
+    """
+    articles: Dict[str, Dict[str, Any] | None] = dict.fromkeys(pages)
+    fetched = {}
+    for url, html in pages.items():
+        if isinstance(html, BaseException):
+            _log(f"記事取得エラー: {url} - {html}")
+        else:
+            fetched[url] = html
+    
+    if fetched:
+        # BERTをロード済みのプロセスをforkで複製しないよう、ワーカーは常にspawnで起動する
+        # （ワーカーで読み込むのは article_parser と軽量なimportだけ）
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            parsed = executor.map(
+                parse_page_safe, fetched.keys(), fetched.values(), chunksize=PARSE_CHUNKSIZE
+            )
+            for url, (article, error) in zip(fetched, parsed):
+                if error is not None:
+                    _log(f"記事解析エラー: {url} - {error}")
+                articles[url] = article
+    
+    return articles
+
 def display_article(article: Dict[str, Any]) -> None:
     """
     記事情報を見やすく表示する
@@ -276,41 +516,55 @@ def process_csv_articles(csv_file_path: str) -> pd.DataFrame:
     """
     CSVファイルからURLを読み込み、記事をスクレイピングして感情分析を実行
     """
+    import pandas as pd
+    
     print(f"CSVファイルを読み込み中: {csv_file_path}")
     
     try:
         # CSVファイルを読み込み
-        df = pd.read_csv(csv_file_path)
+        # 必要な列だけを読み込み、日付は読み込み時に列全体をまとめて変換する
+        df = pd.read_csv(
+            csv_file_path, usecols=['date', 'bloomberg_url'],
+            parse_dates=['date'], date_format='%Y-%m-%d'
+        )
+        # 変換できない日付があると文字列のまま残るため、記事を取得する前に止める
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            raise ValueError("date列にYYYY-MM-DD形式でない値が含まれています")
         print(f"総記事数: {len(df)}件")
         
+        # 記事のHTMLを並行して一括取得
+        pages = fetch_pages(df['bloomberg_url'].tolist())
+        
+        # 取得したHTMLを複数コアで並列に解析
+        articles = parse_pages(pages)
+        
+        # 本文を取得できた記事の感情分析をまとめて実行
+        # （BERTはこのプロセスだけでロードし、記事をまたいでバッチ推論する）
+        fetched_articles = [
+            article for article in articles.values()
+            if article and article.get('content') != "本文を取得できませんでした"
+        ]
+        if SENTIMENT_ANALYSIS_AVAILABLE:
+            analyze_articles_sentiment(fetched_articles, verbose=VERBOSE)
+        
         # 結果を格納するリスト
         results = []
         
-        # 進行状況の表示
-        total_articles = len(df)
-        processed = 0
-        
-        for index, row in df.iterrows():
-            processed += 1
-            date_str = row['date']
-            url = row['bloomberg_url']
-            
-            print(f"\n進行状況: {processed}/{total_articles} ({processed/total_articles*100:.1f}%)")
-            print(f"処理中: {date_str} - {url}")
-            
+        for date, url in zip(df['date'], df['bloomberg_url']):
             try:
-                # 記事をスクレイピング
-                article = scrape_single_article(url)
+                # 日付が空の行もNaTのまま残す（NaTはstrftimeできないのでそのまま表示する）
+                date_label = date if pd.isna(date) else f"{date:%Y-%m-%d}"
+                _log(f"処理中: {date_label} - {url}")
+                article = articles[url]
                 
                 if article and article.get('content') != "本文を取得できませんでした":
-                    # 感情分析を実行
+                    # 感情分析の結果を集計
                     if SENTIMENT_ANALYSIS_AVAILABLE:
-                        analyzed_article = analyze_article_sentiment(article)
-                        sentiment = analyzed_article.get('sentiment', {})
+                        sentiment = article.get('sentiment', {})
                         
                         if sentiment.get('available', False):
                             results.append({
-                                'date': pd.to_datetime(date_str),
+                                'date': date,
                                 'url': url,
                                 'title': article.get('title', 'タイトル不明'),
                                 'sentiment_score': sentiment['average_score'],
@@ -320,12 +574,12 @@ def process_csv_articles(csv_file_path: str) -> pd.DataFrame:
                                 'neutral_count': sentiment['neutral_count'],
                                 'total_sentences': sentiment['total_sentences']
                             })
-                            print(f"✅ 分析完了: {sentiment['overall_sentiment']} (スコア: {sentiment['average_score']:.4f})")
+                            _log(f"✅ 分析完了: {sentiment['overall_sentiment']} (スコア: {sentiment['average_score']:.4f})")
                         else:
-                            print(f"⚠️ 感情分析失敗: {sentiment.get('message', '不明なエラー')}")
+                            _log(f"⚠️ 感情分析失敗: {sentiment.get('message', '不明なエラー')}")
                     else:
                         results.append({
-                            'date': pd.to_datetime(date_str),
+                            'date': date,
                             'url': url,
                             'title': article.get('title', 'タイトル不明'),
                             'sentiment_score': 0.0,
@@ -335,19 +589,16 @@ def process_csv_articles(csv_file_path: str) -> pd.DataFrame:
                             'neutral_count': 0,
                             'total_sentences': 0
                         })
-                        print("⚠️ BERT感情分析が利用できません")
+                        _log("⚠️ BERT感情分析が利用できません")
                 else:
-                    print("❌ 記事の取得に失敗")
+                    _log("❌ 記事の取得に失敗")
                     
             except Exception as e:
-                print(f"❌ エラー: {e}")
-                
-            # リクエスト間隔を調整（サーバー負荷軽減）
-            time.sleep(2)
+                _log(f"❌ エラー: {e}")
         
         # 結果をDataFrameに変換
         results_df = pd.DataFrame(results)
-        print(f"\n処理完了: {len(results_df)}件の記事を分析しました")
+        print(f"処理完了: {len(results_df)}件の記事を分析しました（詳細: {LOG_FILE}）")
         return results_df
         
     except Exception as e:
@@ -362,8 +613,9 @@ def create_sentiment_timeline_chart(df: pd.DataFrame, save_path: str = "sentimen
         print("データが空のため、グラフを作成できません")
         return
     
-    # 日本語フォント設定
-    plt.rcParams['font.family'] = ['DejaVu Sans', 'Hiragino Sans', 'Yu Gothic', 'Meiryo', 'Takao', 'IPAexGothic', 'IPAPGothic', 'VL PGothic', 'Noto Sans CJK JP']
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    plt.rcParams['font.family'] = JAPANESE_FONTS
     
     # 図のサイズを設定
     fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(15, 12))
@@ -448,6 +700,13 @@ def main():
     """
     メイン関数：ユーザーに選択肢を提供してニュース記事を取得
     """
+    logging.basicConfig(
+        filename=LOG_FILE,
+        encoding='utf-8',
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(message)s'
+    )
+    
     print("=== ニュース記事取得・感情分析システム ===")
     print("利用可能な機能:")
     print("1. 記事取得（URL指定）")